@@ -0,0 +1,15 @@
+from estimateur.core import (
+    AJUSTEMENTS,
+    BienImmobilier,
+    Standing,
+    analyser_marche,
+    generer_donnees_demo,
+)
+
+__all__ = [
+    'AJUSTEMENTS',
+    'BienImmobilier',
+    'Standing',
+    'analyser_marche',
+    'generer_donnees_demo',
+]
@@ -0,0 +1,145 @@
+"""
+Cœur partagé des estimateurs : modélisation du bien, coefficients de
+standing, génération des données de démonstration et analyse de marché.
+Les scripts Streamlit ne sont plus que de minces points d'entrée.
+"""
+import pandas as pd
+from dataclasses import dataclass
+from enum import Enum
+import numpy as np
+import streamlit as st
+
+# --- MODÉLISATION ---
+class Standing(Enum):
+    """
+    Chaque membre garde son libellé français comme valeur (c'est lui qui est
+    affiché dans l'interface) et reçoit en plus un indice entier dans l'ordre
+    de déclaration : AJUSTEMENTS[standing.indice] est alors une indexation
+    directe de tableau, sans sondage de dict, et reste vectorisable si un
+    mode batch multi-biens apparaît un jour.
+    """
+    def __new__(cls, libelle):
+        membre = object.__new__(cls)
+        membre._value_ = libelle
+        membre.indice = len(cls.__members__)
+        return membre
+
+    A_RENOVER = "À rénover"
+    STANDARD = "Standard"
+    HAUT_DE_GAMME = "Haut de gamme"
+
+@dataclass(frozen=True, slots=True)
+class BienImmobilier:
+    code_insee: str
+    ville: str
+    surface_habitable: float
+    nombre_pieces: int
+    standing: Standing
+
+# Coefficients d'ajustement, dans l'ordre des indices de Standing (float64 :
+# 0.85 et 1.20 y ont une repr exacte, affichée telle quelle dans l'interface)
+AJUSTEMENTS = np.array([0.85, 1.0, 1.20])
+
+# Libellé affiché dans l'interface → membre de l'enum, construit une fois à l'import
+STANDING_MAP = {s.value: s for s in Standing}
+
+_SEP_MILLIERS = str.maketrans({',': ' '})
+
+def _euro(x: int) -> str:
+    """Formate un montant avec l'espace fine insécable comme séparateur de
+    milliers (typographie française) ; la table de translation est précompilée
+    une fois à l'import et str.translate évite la recherche de sous-chaîne
+    de str.replace."""
+    return format(x, ',d').translate(_SEP_MILLIERS) + ' €'
+
+# --- DONNÉES SIMULÉES (pour démo) ---
+@st.cache_data(ttl=3600)
+def generer_donnees_demo(code_insee: str):
+    """
+    Génère des données réalistes pour la démonstration
+    En production, cette fonction serait remplacée par l'API DVF
+    """
+    rng = np.random.default_rng(42)  # Pour reproductibilité (PCG64)
+
+    # Générer 150 transactions sur 5 ans : une seule addition vectorisée
+    # datetime64 + timedelta64, pas de datetime Python par ligne
+    n_transactions = 150
+    offsets = rng.integers(0, 1825, n_transactions)
+    dates = np.datetime64('2019-01-01') + offsets.astype('timedelta64[D]')
+
+    # Prix au m² avec tendance haussière : base 2000€/m² en 2019 → 2500€/m² en 2024
+    # (float32 suffit largement pour des prix simulés et divise par deux la
+    # bande passante mémoire des réductions en aval)
+    annees = dates.astype('datetime64[Y]').astype(int) + 1970
+    prix_m2_base = 2000 + (annees - 2019) * 100
+    prix_m2 = (prix_m2_base + rng.normal(0, 200, n_transactions)).astype(np.float32)
+
+    # Surfaces entre 30 et 150 m²
+    surfaces = rng.uniform(30, 150, n_transactions).astype(np.float32)
+
+    # Valeurs foncières
+    valeurs = prix_m2 * surfaces
+
+    df = pd.DataFrame({
+        'date_mutation': dates,
+        'valeur_fonciere': valeurs,
+        'surface_reelle_bati': surfaces
+    })
+
+    return df
+
+# --- ANALYSE ---
+def _calculer_stats(valeur, surface, annees):
+    """
+    Noyau numérique : tableaux bruts en entrée, scalaires et tableaux en
+    sortie, sans aucun objet pandas. C'est le point unique où poser un
+    @numba.njit si le volume de données le justifie un jour.
+    """
+    prix_m2 = valeur / surface
+
+    # Évolution par année : deux accumulations bincount au lieu du groupby pandas,
+    # largement surdimensionné pour ~150 lignes sur 5 années
+    a0 = annees.min()
+    idx = annees - a0
+    evolution_annees = np.arange(a0, a0 + idx.max() + 1)
+    evolution_vals = np.bincount(idx, weights=prix_m2) / np.bincount(idx)
+
+    # Réductions NumPy directes, sans enrobage Series
+    return (prix_m2.min(), prix_m2.max(), prix_m2.mean(), np.median(prix_m2),
+            evolution_annees, evolution_vals)
+
+@st.cache_data(ttl=3600)
+def analyser_marche(df: pd.DataFrame):
+    """
+    Partie calcul pure (mise en cache) : prix moyen, statistiques et
+    évolution annuelle avec tendance, prêtes à tracer côté client
+    via st.line_chart (pas de rendu matplotlib côté serveur).
+    """
+    if df.empty:
+        return 0.0, None, None
+
+    mn, mx, prix_moyen_global, mediane, evolution_annees, evolution_vals = _calculer_stats(
+        df['valeur_fonciere'].to_numpy(),
+        df['surface_reelle_bati'].to_numpy(),
+        df['date_mutation'].dt.year.to_numpy().astype(np.int32)
+    )
+
+    stats = {
+        'min': int(mn),
+        'max': int(mx),
+        'moyen': int(prix_moyen_global),
+        'mediane': int(mediane)
+    }
+
+    # Ligne de tendance : moindres carrés en forme close, la résolution SVD
+    # de polyfit est superflue pour une poignée de points
+    x = evolution_annees.astype(np.float64)
+    xm, ym = x.mean(), evolution_vals.mean()
+    pente = ((x - xm) * (evolution_vals - ym)).sum() / ((x - xm) ** 2).sum()
+
+    df_graphique = pd.DataFrame({
+        'Moyenne': evolution_vals,
+        'Tendance': ym + pente * (x - xm)
+    }, index=evolution_annees)
+
+    return prix_moyen_global, df_graphique, stats
@@ -1,118 +1,357 @@
+import os
 import requests
 import pandas as pd
-import matplotlib
-matplotlib.use('Agg')  # ← CORRECTION pour Streamlit Cloud
-import matplotlib.pyplot as plt
-from dataclasses import dataclass
-from enum import Enum
 import streamlit as st
-from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import numpy as np
 
-# --- 1. MODÉLISATION ---
-class Standing(Enum):
-    A_RENOVER = "À rénover"
-    STANDARD = "Standard"
-    HAUT_DE_GAMME = "Haut de gamme"
-
-@dataclass
-class BienImmobilier:
-    code_insee: str
-    ville: str
-    surface_habitable: float
-    nombre_pieces: int
-    standing: Standing
-
-# --- 2. RÉCUPÉRATION DES DONNÉES DVF RÉELLES ---
-def recuperer_transactions_dvf(code_insee: str):
+from estimateur.core import (AJUSTEMENTS, _euro,
+                             BienImmobilier, Standing, STANDING_MAP)
+
+# Millésime DVF interrogé et cache disque des téléchargements : les données
+# d'une année passée sont immuables, inutile de re-télécharger 1 à 10 Mo
+# à chaque estimation
+DVF_ANNEE = "2023"
+DVF_CACHE_DIR = Path(".dvf_cache")
+
+# Session HTTP persistante (keep-alive : poignée de main TCP/TLS payée une
+# seule fois) et exécuteur de préchargement des communes d'exemple affichées
+# dans la barre latérale — le temps que l'utilisateur clique, leurs données
+# sont déjà chaudes sur disque
+_SESSION = requests.Session()
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+_CODES_EXEMPLES = ('33063', '75056', '69123', '13055')
+
+# pyarrow reste une dépendance optionnelle : quand il est installé, le
+# parsing passe par son lecteur CSV multithreadé (branche Arrow de
+# _parser_filtrer_dvf) et le frame filtré persiste en Parquet
+try:
+    import pyarrow  # noqa: F401
+    _PARQUET_DISPONIBLE = True
+except ImportError:
+    _PARQUET_DISPONIBLE = False
+
+# Projection et typage DVF : seules ces 5 colonnes (sur ~40) sont parsées.
+# float32 suffit pour des valeurs foncières (< 1e9, erreur relative < 0,01 %)
+# et divise par deux la bande passante mémoire des masques et réductions
+_DVF_COLONNES = ['date_mutation', 'valeur_fonciere', 'surface_reelle_bati',
+                 'nature_mutation', 'type_local']
+_DVF_DTYPES = {'valeur_fonciere': 'float32', 'surface_reelle_bati': 'float32',
+               'nature_mutation': 'category', 'type_local': 'category'}
+
+# --- 1. RÉCUPÉRATION DES DONNÉES DVF RÉELLES ---
+def _parser_filtrer_dvf(cache_path):
     """
-    Récupère les transactions DVF depuis l'API officielle data.gouv.fr
+    Parse le CSV en cache et applique les filtres Vente / Maison-Appartement /
+    surface > 0, en ne gardant que les trois colonnes utiles. Avec pyarrow, le
+    pipeline reste intégralement côté Arrow (lecteur CSV multithreadé puis
+    noyaux pyarrow.compute SIMD) et ne repasse en pandas qu'à la fin.
+    """
+    if _PARQUET_DISPONIBLE:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        from pyarrow import csv as pa_csv
+
+        table = pa_csv.read_csv(
+            cache_path,
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=_DVF_COLONNES,
+                column_types={'valeur_fonciere': pa.float32(),
+                              'surface_reelle_bati': pa.float32()}
+            )
+        )
+        masque = pc.and_(
+            pc.and_(pc.equal(table['nature_mutation'], 'Vente'),
+                    pc.is_in(table['type_local'], value_set=pa.array(['Maison', 'Appartement']))),
+            pc.greater(table['surface_reelle_bati'], 0)
+        )
+        table = table.filter(masque).select(['date_mutation', 'valeur_fonciere', 'surface_reelle_bati'])
+        # Seule l'année est utile en aval : int16 (2 octets/ligne) au lieu
+        # d'un datetime64 complet (8 octets/ligne)
+        annee = pc.cast(pc.year(table['date_mutation']), pa.int16())
+        table = table.drop_columns(['date_mutation']).append_column('annee', annee)
+        return table.to_pandas()
+
+    # Repli pandas : projection et typage poussés dans le parseur C,
+    # un seul masque booléen fusionné
+    df = pd.read_csv(
+        cache_path,
+        usecols=_DVF_COLONNES,
+        dtype=_DVF_DTYPES,
+        parse_dates=['date_mutation'],
+        engine='c'
+    )
+    masque = (df['nature_mutation'].eq('Vente')
+              & df['type_local'].isin(['Maison', 'Appartement'])
+              & (df['surface_reelle_bati'] > 0))
+    df_sel = df.loc[masque, ['valeur_fonciere', 'surface_reelle_bati']].copy()
+    # Seule l'année est utile en aval : int16 (2 octets/ligne) au lieu
+    # d'un datetime64 complet (8 octets/ligne)
+    df_sel['annee'] = df.loc[masque, 'date_mutation'].dt.year.astype('int16')
+    return df_sel
+
+@st.cache_data(ttl=86400, max_entries=64, persist="disk", show_spinner=False)
+def _fetch_dvf(code_insee: str):
+    """
+    Téléchargement + parsing + filtrage DVF, mémoïsés par code INSEE.
+    TTL de 24h, borné à 64 communes pour que le cache ne grossisse pas
+    sans limite ; persist="disk" survit aux redémarrages du conteneur.
     """
     departement = code_insee[:2]
-    url = f"https://files.data.gouv.fr/geo-dvf/latest/csv/2023/communes/{departement}/{code_insee}.csv"
-    
-    try:
-        response = requests.get(url, timeout=15)
-        
-        if response.status_code == 200:
-            # Lecture du CSV
-            df = pd.read_csv(StringIO(response.text))
-            
-            # Filtrage
-            df_ventes = df[df['nature_mutation'] == 'Vente']
-            df_logements = df_ventes[df_ventes['type_local'].isin(['Maison', 'Appartement'])]
-            
-            if df_logements.empty:
-                return pd.DataFrame(), "Aucune transaction trouvée pour cette commune"
-            
-            # Sélection des colonnes
-            df_final = df_logements[['date_mutation', 'valeur_fonciere', 'surface_reelle_bati']].copy()
-            df_final['date_mutation'] = pd.to_datetime(df_final['date_mutation'])
-            df_final['valeur_fonciere'] = pd.to_numeric(df_final['valeur_fonciere'], errors='coerce')
-            df_final['surface_reelle_bati'] = pd.to_numeric(df_final['surface_reelle_bati'], errors='coerce')
-            
-            # Filtre surface > 0 et valeurs non nulles
-            df_final = df_final.dropna()
-            df_final = df_final[df_final['surface_reelle_bati'] > 0]
-            
-            if df_final.empty:
-                return pd.DataFrame(), "Données incomplètes pour cette commune"
-            
-            return df_final, None
-        else:
+    url = f"https://files.data.gouv.fr/geo-dvf/latest/csv/{DVF_ANNEE}/communes/{departement}/{code_insee}.csv"
+    cache_path = DVF_CACHE_DIR / f"{code_insee}_{DVF_ANNEE}.csv"
+    parquet_path = DVF_CACHE_DIR / f"{code_insee}_{DVF_ANNEE}.parquet"
+
+    # Le frame filtré (3 colonnes) persiste en Parquet : le relire est ~10x
+    # plus rapide que re-parser le CSV, et survit aux redémarrages quand le
+    # cache Streamlit en mémoire est perdu
+    if _PARQUET_DISPONIBLE and parquet_path.exists():
+        return pd.read_parquet(parquet_path), None
+
+    if not cache_path.exists():
+        # Les incidents transitoires (timeout, coupure, 5xx du serveur)
+        # remontent en exception : st.cache_data ne mémoïse pas les
+        # exceptions, donc ils ne figent pas 24h d'erreur pour la commune —
+        # seuls les fetchs réussis et les erreurs stables (4xx, commune
+        # vide) sont mis en cache. La traduction en message se fait chez
+        # l'appelant.
+        response = _SESSION.get(url, timeout=15, stream=True)
+
+        if response.status_code != 200:
+            # Le corps (page d'erreur HTML) n'est jamais lu : avec
+            # stream=True, close() rend la connexion sans le matérialiser
+            response.close()
+            if response.status_code >= 500:
+                response.raise_for_status()
             return pd.DataFrame(), f"API non disponible (code {response.status_code})"
-            
-    except Exception as e:
-        return pd.DataFrame(), f"Erreur de connexion : {str(e)}"
 
-# --- 3. ANALYSE ET VISUALISATION ---
+        # Écriture en flux vers le cache : le CSV n'est jamais matérialisé
+        # en entier en mémoire (ni en bytes, ni en str intermédiaire).
+        # Le flux passe par un fichier temporaire renommé à la fin : une
+        # coupure réseau en cours de transfert ne laisse jamais un CSV
+        # tronqué sous cache_path (qui serait ensuite parsé sans erreur)
+        DVF_CACHE_DIR.mkdir(exist_ok=True)
+        tmp_path = cache_path.with_suffix('.csv.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                for morceau in response.iter_content(chunk_size=1 << 16):
+                    f.write(morceau)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    df_logements = _parser_filtrer_dvf(cache_path)
+
+    if df_logements.empty:
+        return pd.DataFrame(), "Aucune transaction trouvée pour cette commune"
+
+    # Valeurs non nulles
+    df_final = df_logements.dropna()
+
+    if df_final.empty:
+        return pd.DataFrame(), "Données incomplètes pour cette commune"
+
+    if _PARQUET_DISPONIBLE:
+        df_final.to_parquet(parquet_path, compression='snappy')
+
+    return df_final, None
+
+def recuperer_transactions_dvf(code_insee: str):
+    """
+    Récupère les transactions DVF depuis l'API officielle data.gouv.fr
+    (réponse servie depuis le cache Streamlit pour les communes déjà vues)
+    """
+    return _fetch_dvf(code_insee)
+
+# --- 2. ANALYSE ET VISUALISATION ---
 def analyser_marche(df: pd.DataFrame):
+    """
+    Partie calcul pure : prix moyen, statistiques et évolution annuelle
+    avec tendance, prêtes à tracer côté client via st.line_chart
+    (pas de rendu matplotlib côté serveur).
+    """
     if df.empty:
         return 0.0, None, None
 
-    # Calcul du prix au m²
-    df['prix_m2'] = df['valeur_fonciere'] / df['surface_reelle_bati']
-    
-    # Suppression des outliers (prix au m² aberrants)
-    q1 = df['prix_m2'].quantile(0.05)
-    q99 = df['prix_m2'].quantile(0.95)
-    df_clean = df[(df['prix_m2'] >= q1) & (df['prix_m2'] <= q99)]
-    
+    # Calcul du prix au m² sur des tableaux NumPy bruts : le DataFrame d'entrée
+    # n'est plus muté (aucune colonne dérivée, pas de comptabilité d'index)
+    prix_m2 = df['valeur_fonciere'].to_numpy() / df['surface_reelle_bati'].to_numpy()
+
+    # Suppression des outliers (prix au m² aberrants) : les deux bornes en une
+    # seule passe de partitionnement. Spécialisation petites communes : sous
+    # 20 ventes, l'écrêtage 5 %/95 % ne mordrait que sur les extrêmes d'un
+    # échantillon déjà maigre (et viderait complètement 1 ou 2 ventes), on
+    # garde alors toutes les transactions
+    if prix_m2.size >= 20:
+        q1, q99 = np.quantile(prix_m2, [0.05, 0.95])
+        garder = (prix_m2 >= q1) & (prix_m2 <= q99)
+        prix_clean = prix_m2[garder]
+    else:
+        garder = slice(None)
+        prix_clean = prix_m2
+
     # Moyenne globale
-    prix_moyen_global = df_clean['prix_m2'].mean()
-    
-    # Évolution par année
-    df_clean['annee'] = df_clean['date_mutation'].dt.year
-    evolution = df_clean.groupby('annee')['prix_m2'].mean().sort_index()
-    
-    # Statistiques
+    prix_moyen_global = prix_clean.mean()
+
+    # Évolution par année : unique + bincount plutôt qu'un groupby pandas,
+    # surdimensionné pour une cardinalité de quelques années (un fichier DVF
+    # communal ne couvre qu'un millésime) ; la petite Series ne sert qu'au tracé
+    annees = df['annee'].to_numpy()[garder]
+    annees_uniques, inverse = np.unique(annees, return_inverse=True)
+    evolution_vals = np.bincount(inverse, weights=prix_clean) / np.bincount(inverse)
+
+    # Ligne de tendance si suffisamment de points (moindres carrés en forme
+    # close, la résolution SVD de polyfit est superflue pour quelques années)
+    colonnes = {'Moyenne': evolution_vals}
+    if annees_uniques.size > 1:
+        x = annees_uniques.astype(np.float64)
+        xm, ym = x.mean(), evolution_vals.mean()
+        pente = ((x - xm) * (evolution_vals - ym)).sum() / ((x - xm) ** 2).sum()
+        colonnes['Tendance'] = ym + pente * (x - xm)
+    df_graphique = pd.DataFrame(colonnes, index=annees_uniques)
+
+    # Statistiques : min, médiane et max sortent d'une seule passe de
+    # partitionnement au lieu de trois réductions séparées
+    q0, q50, q100 = np.percentile(prix_clean, [0, 50, 100])
     stats = {
-        'min': int(df_clean['prix_m2'].min()),
-        'max': int(df_clean['prix_m2'].max()),
+        'min': int(q0),
+        'max': int(q100),
         'moyen': int(prix_moyen_global),
-        'mediane': int(df_clean['prix_m2'].median()),
-        'nb_transactions': len(df_clean)
+        'mediane': int(q50),
+        'nb_transactions': int(prix_clean.size),
+        'outliers_exclus': prix_clean.size != prix_m2.size
     }
-    
-    # Graphique
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.plot(evolution.index, evolution.values, marker='o', color='#2ecc71', linewidth=2, markersize=8)
-    ax.set_title(f"Évolution du prix au m² - Données DVF réelles", fontsize=14, fontweight='bold')
-    ax.grid(True, linestyle='--', alpha=0.3)
-    ax.set_ylabel("Prix €/m²", fontsize=11)
-    ax.set_xlabel("Année", fontsize=11)
-    
-    # Ligne de tendance si suffisamment de données
-    if len(evolution) > 1:
-        z = np.polyfit(evolution.index, evolution.values, 1)
-        p = np.poly1d(z)
-        ax.plot(evolution.index, p(evolution.index), "r--", alpha=0.5, 
-                label=f"Tendance: {'+' if z[0]>0 else ''}{int(z[0])}€/an")
-        ax.legend()
-    
-    plt.tight_layout()
-    
-    return prix_moyen_global, fig, stats
+
+    return prix_moyen_global, df_graphique, stats
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _analyse_commune(code_insee: str):
+    """
+    Fetch + analyse mémoïsés par commune : un second clic sur le même code
+    INSEE ne refait ni le téléchargement ni les statistiques.
+    """
+    df, erreur = _fetch_dvf(code_insee)
+    if df.empty:
+        return 0.0, None, None, erreur
+
+    prix_moyen, df_graphique, stats = analyser_marche(df)
+    return prix_moyen, df_graphique, stats, None
+
+# --- 3. AFFICHAGE DES RÉSULTATS ---
+@st.fragment
+def afficher_resultats(mon_bien: BienImmobilier):
+    """
+    Bloc de résultats isolé dans un fragment : ses reruns ne rejouent pas
+    tout le script, les données et le graphique ne dépendant que du bien
+    saisi (fetch et analyse sont de toute façon mémoïsés par code INSEE).
+    """
+    with st.spinner(f"🔄 Récupération des données DVF pour {mon_bien.ville}..."):
+        # Récupération et analyse des données RÉELLES (mémoïsées par commune ;
+        # les pannes réseau remontent en exception et ne sont donc jamais
+        # mises en cache — le prochain clic retente le téléchargement)
+        try:
+            prix_moyen_m2, df_graphique, stats, erreur = _analyse_commune(mon_bien.code_insee)
+        except (requests.RequestException, OSError) as e:
+            prix_moyen_m2, df_graphique, stats = 0.0, None, None
+            erreur = f"Erreur de connexion : {str(e)}"
+
+        if erreur is not None:
+            st.error(f"❌ {erreur}")
+            st.info("""
+            **Suggestions:**
+            - Vérifiez que le code INSEE est correct
+            - Essayez une ville plus grande (ex: 33063 pour Bordeaux)
+            - Certaines petites communes n'ont pas assez de transactions
+            """)
+            return
+        
+        if prix_moyen_m2 == 0:
+            st.error("❌ Impossible d'analyser les données de cette commune")
+            return
+
+        # Ajustement selon le standing (coefficients module partagés)
+        coefficient = float(AJUSTEMENTS[mon_bien.standing.indice])
+        prix_ajuste_m2 = prix_moyen_m2 * coefficient
+        estimation_finale = prix_ajuste_m2 * mon_bien.surface_habitable
+        
+        # Affichage des résultats
+        st.success(f"✅ {stats['nb_transactions']} transactions DVF analysées pour {mon_bien.ville}")
+        
+        # Colonnes pour l'affichage
+        col1, col2 = st.columns([1, 1])
+        
+        with col1:
+            st.subheader("📊 Statistiques du marché (DVF)")
+            
+            metric_col1, metric_col2 = st.columns(2)
+            with metric_col1:
+                st.metric("Prix minimum", _euro(stats['min']) + "/m²")
+                st.metric("Prix moyen", _euro(stats['moyen']) + "/m²")
+            with metric_col2:
+                st.metric("Prix maximum", _euro(stats['max']) + "/m²")
+                st.metric("Médiane", _euro(stats['mediane']) + "/m²")
+            
+            st.info(f"📈 **{stats['nb_transactions']}** transactions immobilières analysées")
+            
+            st.markdown("---")
+            
+            st.subheader("🏠 Détails de l'estimation")
+            st.write(f"**Localisation:** {mon_bien.ville} ({mon_bien.code_insee})")
+            st.write(f"**Surface:** {mon_bien.surface_habitable} m²")
+            st.write(f"**Pièces:** {mon_bien.nombre_pieces}")
+            st.write(f"**Standing:** {mon_bien.standing.value}")
+            st.write(f"**Coefficient appliqué:** {coefficient}")
+        
+        with col2:
+            st.subheader("📈 Évolution des prix (DVF)")
+            st.line_chart(df_graphique)
+            st.caption("Graphique basé sur les transactions réelles enregistrées")
+        
+        # Résultat final en grand
+        st.markdown("---")
+        st.markdown("## 💰 RÉSULTAT DE L'ESTIMATION")
+        
+        result_col1, result_col2, result_col3 = st.columns(3)
+        
+        with result_col1:
+            st.metric(
+                "Fourchette basse (-5%)",
+                _euro(int(estimation_finale * 0.95))
+            )
+        
+        with result_col2:
+            st.metric(
+                "VALEUR ESTIMÉE",
+                _euro(int(estimation_finale)),
+                delta=None
+            )
+        
+        with result_col3:
+            st.metric(
+                "Fourchette haute (+5%)",
+                _euro(int(estimation_finale * 1.05))
+            )
+        
+        # Note d'information
+        st.success("""
+        ✅ **Estimation basée sur des données officielles DVF**
+        
+        Les Demandes de Valeurs Foncières (DVF) sont les données officielles de l'administration fiscale 
+        concernant les transactions immobilières en France.
+        """)
+        
+        # Détails techniques (repliable)
+        with st.expander("🔍 Détails techniques"):
+            st.write(f"**Source des données:** API data.gouv.fr")
+            st.write(f"**Année des données:** {DVF_ANNEE}")
+            st.write(f"**Nombre de transactions brutes:** {stats['nb_transactions']}")
+            st.write(f"**Filtres appliqués:** Ventes uniquement, Maisons et Appartements, Surface > 0m²")
+            if stats['outliers_exclus']:
+                st.write(f"**Outliers exclus:** 5% prix les plus bas et 5% prix les plus élevés")
+            else:
+                st.write(f"**Outliers exclus:** aucun (échantillon trop petit pour l'écrêtage)")
 
 # --- 4. APPLICATION STREAMLIT ---
 def main():
@@ -153,128 +392,24 @@ def main():
             ["Standard", "À rénover", "Haut de gamme"]
         )
         
-        # Mapping vers l'enum
-        standing_map = {
-            "Standard": Standing.STANDARD,
-            "À rénover": Standing.A_RENOVER,
-            "Haut de gamme": Standing.HAUT_DE_GAMME
-        }
-        input_standing = standing_map[input_standing_label]
+        # Mapping vers l'enum (table module construite à l'import)
+        input_standing = STANDING_MAP[input_standing_label]
         
         st.markdown("---")
         estimer_button = st.button("💰 Estimer avec données réelles", type="primary", use_container_width=True)
     
+    # Préchargement en arrière-plan des communes d'exemple au premier run :
+    # leurs fetchs remplissent le cache disque pendant que l'utilisateur saisit
+    if not st.session_state.get('prefetch_fait'):
+        st.session_state.prefetch_fait = True
+        for code in _CODES_EXEMPLES:
+            _EXECUTOR.submit(_fetch_dvf, code)
+
     # Zone principale
     if estimer_button:
-        with st.spinner(f"🔄 Récupération des données DVF pour {input_ville}..."):
-            # Création du bien
-            mon_bien = BienImmobilier(input_insee, input_ville, input_surface, input_pieces, input_standing)
-            
-            # Récupération des données RÉELLES
-            df_transactions, erreur = recuperer_transactions_dvf(mon_bien.code_insee)
-            
-            if df_transactions.empty:
-                st.error(f"❌ {erreur}")
-                st.info("""
-                **Suggestions:**
-                - Vérifiez que le code INSEE est correct
-                - Essayez une ville plus grande (ex: 33063 pour Bordeaux)
-                - Certaines petites communes n'ont pas assez de transactions
-                """)
-                return
-            
-            # Analyse
-            prix_moyen_m2, fig, stats = analyser_marche(df_transactions)
-            
-            if prix_moyen_m2 == 0:
-                st.error("❌ Impossible d'analyser les données de cette commune")
-                return
-            
-            # Ajustement selon le standing
-            ajustements = {
-                Standing.A_RENOVER: 0.85,
-                Standing.STANDARD: 1.0,
-                Standing.HAUT_DE_GAMME: 1.20
-            }
-            
-            coefficient = ajustements[mon_bien.standing]
-            prix_ajuste_m2 = prix_moyen_m2 * coefficient
-            estimation_finale = prix_ajuste_m2 * mon_bien.surface_habitable
-            
-            # Affichage des résultats
-            st.success(f"✅ {stats['nb_transactions']} transactions DVF analysées pour {mon_bien.ville}")
-            
-            # Colonnes pour l'affichage
-            col1, col2 = st.columns([1, 1])
-            
-            with col1:
-                st.subheader("📊 Statistiques du marché (DVF)")
-                
-                metric_col1, metric_col2 = st.columns(2)
-                with metric_col1:
-                    st.metric("Prix minimum", f"{stats['min']:,} €/m²".replace(',', ' '))
-                    st.metric("Prix moyen", f"{stats['moyen']:,} €/m²".replace(',', ' '))
-                with metric_col2:
-                    st.metric("Prix maximum", f"{stats['max']:,} €/m²".replace(',', ' '))
-                    st.metric("Médiane", f"{stats['mediane']:,} €/m²".replace(',', ' '))
-                
-                st.info(f"📈 **{stats['nb_transactions']}** transactions immobilières analysées")
-                
-                st.markdown("---")
-                
-                st.subheader("🏠 Détails de l'estimation")
-                st.write(f"**Localisation:** {mon_bien.ville} ({mon_bien.code_insee})")
-                st.write(f"**Surface:** {mon_bien.surface_habitable} m²")
-                st.write(f"**Pièces:** {mon_bien.nombre_pieces}")
-                st.write(f"**Standing:** {mon_bien.standing.value}")
-                st.write(f"**Coefficient appliqué:** {coefficient}")
-            
-            with col2:
-                st.subheader("📈 Évolution des prix (DVF)")
-                st.pyplot(fig)
-                st.caption("Graphique basé sur les transactions réelles enregistrées")
-            
-            # Résultat final en grand
-            st.markdown("---")
-            st.markdown("## 💰 RÉSULTAT DE L'ESTIMATION")
-            
-            result_col1, result_col2, result_col3 = st.columns(3)
-            
-            with result_col1:
-                st.metric(
-                    "Fourchette basse (-5%)",
-                    f"{int(estimation_finale * 0.95):,} €".replace(',', ' ')
-                )
-            
-            with result_col2:
-                st.metric(
-                    "VALEUR ESTIMÉE",
-                    f"{int(estimation_finale):,} €".replace(',', ' '),
-                    delta=None
-                )
-            
-            with result_col3:
-                st.metric(
-                    "Fourchette haute (+5%)",
-                    f"{int(estimation_finale * 1.05):,} €".replace(',', ' ')
-                )
-            
-            # Note d'information
-            st.success("""
-            ✅ **Estimation basée sur des données officielles DVF**
-            
-            Les Demandes de Valeurs Foncières (DVF) sont les données officielles de l'administration fiscale 
-            concernant les transactions immobilières en France.
-            """)
-            
-            # Détails techniques (repliable)
-            with st.expander("🔍 Détails techniques"):
-                st.write(f"**Source des données:** API data.gouv.fr")
-                st.write(f"**Année des données:** 2023")
-                st.write(f"**Nombre de transactions brutes:** {stats['nb_transactions']}")
-                st.write(f"**Filtres appliqués:** Ventes uniquement, Maisons et Appartements, Surface > 0m²")
-                st.write(f"**Outliers exclus:** 5% prix les plus bas et 5% prix les plus élevés")
-    
+        mon_bien = BienImmobilier(input_insee, input_ville, input_surface, input_pieces, input_standing)
+        afficher_resultats(mon_bien)
+
     else:
         # Message d'accueil
         st.info("👈 Configurez les paramètres dans la barre latérale et cliquez sur **Estimer avec données réelles**")